@@ -1,11 +1,23 @@
 import wx
 import os
-from typing import Optional, Dict, List
+import bisect
+import concurrent.futures
+import configparser
+import functools
+import io
+import re
+import sqlite3
+import stat
+import threading
+from contextlib import closing
+from typing import Optional, Dict, List, Tuple
 
 import imaplib
 import smtplib
-import email
+import email.policy
 from email.header import decode_header
+from email.message import EmailMessage
+from email.parser import BytesFeedParser, BytesHeaderParser
 
 
 # ============================================================
@@ -63,54 +75,98 @@ class AccountConfig:
         )
 
 
+ACCOUNT_SECTION_PREFIX = "account "
+
+
+def _new_config_parser() -> configparser.ConfigParser:
+    # No interpolation: passwords may legitimately contain "%". Non-strict so a
+    # hand-edited file with a repeated section still loads.
+    return configparser.ConfigParser(interpolation=None, strict=False)
+
+
+# Collects stray key=value lines above the first [account ...] header; it is not
+# an account section, so those lines are ignored.
+_PREAMBLE_SECTION = "preamble"
+
+
+# Bytes last read from or written to CONFIG_FILE, used to skip no-op saves.
+_last_saved_bytes: Optional[bytes] = None
+
+
 def load_all_accounts() -> Dict[str, AccountConfig]:
-    """Load all accounts from accounts.txt (simple INI-like format)."""
+    """Load all accounts from accounts.txt (INI format, one [account <name>] section each)."""
+    global _last_saved_bytes
     if not os.path.exists(CONFIG_FILE):
         return {}
 
-    accounts: Dict[str, AccountConfig] = {}
-    current: Dict[str, str] = {}
-    current_name: Optional[str] = None
-
-    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith("[account ") and line.endswith("]"):
-                # Save the previous account block before starting a new one.
-                if current_name and current:
-                    accounts[current_name] = AccountConfig.from_dict(current)
-
-                current = {}
-                # Extract account name from the section header.
-                current_name = line[len("[account "):-1]
-                current["name"] = current_name
-            else:
-                if "=" in line and current is not None:
-                    key, value = line.split("=", 1)
-                    current[key.strip()] = value.strip()
+    with open(CONFIG_FILE, "rb") as f:
+        data = f.read()
+    _last_saved_bytes = data
 
-    if current_name and current:
-        accounts[current_name] = AccountConfig.from_dict(current)
+    # The file is hand-edited; an indented line is a key, not a continuation.
+    text = "\n".join(line.lstrip() for line in data.decode("utf-8").splitlines())
+    cp = _new_config_parser()
+    try:
+        cp.read_string(f"[{_PREAMBLE_SECTION}]\n" + text, source=CONFIG_FILE)
+    except configparser.ParsingError:
+        # Lines that are not key=value are skipped; the rest of the file was read.
+        pass
 
+    accounts: Dict[str, AccountConfig] = {}
+    for section in cp.sections():
+        if not section.startswith(ACCOUNT_SECTION_PREFIX):
+            continue
+        # Extract account name from the section header.
+        name = section[len(ACCOUNT_SECTION_PREFIX):]
+        accounts[name] = AccountConfig.from_dict({**cp[section], "name": name})
     return accounts
 
 
+def _serialize_accounts(accounts: Dict[str, AccountConfig]) -> bytes:
+    cp = _new_config_parser()
+    for acc in accounts.values():
+        # Each account is written as its own section header.
+        d = acc.to_dict()
+        del d["name"]
+        cp[ACCOUNT_SECTION_PREFIX + acc.name] = d
+    buf = io.StringIO()
+    # key=value without spaces keeps the file format unchanged.
+    cp.write(buf, space_around_delimiters=False)
+    return buf.getvalue().encode("utf-8")
+
+
 def save_all_accounts(accounts: Dict[str, AccountConfig]) -> None:
-    """Save all accounts to accounts.txt."""
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        for acc in accounts.values():
-            # Each account is written as its own section header.
-            f.write(f"[account {acc.name}]\n")
-            d = acc.to_dict()
-            for key, val in d.items():
-                if key == "name":
-                    continue
-                # Write key=value pairs in a simple INI-like format.
-                f.write(f"{key}={val}\n")
-            f.write("\n")
+    """Save all accounts to accounts.txt, atomically and only if something changed."""
+    global _last_saved_bytes
+    data = _serialize_accounts(accounts)
+    if data == _last_saved_bytes:
+        return
+
+    # Keep the permissions the user gave the file; a new file holds plaintext
+    # passwords, so it starts out readable by the owner only.
+    try:
+        mode = stat.S_IMODE(os.stat(CONFIG_FILE).st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+
+    # Write a temp file and swap it in, so a crash never leaves a truncated file.
+    tmp_path = CONFIG_FILE + ".tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            os.chmod(tmp_path, mode)
+            f.write(data)
+            # The data must be on disk before the rename makes it the live file.
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _last_saved_bytes = data
 
 
 # ============================================================
@@ -120,16 +176,38 @@ def save_all_accounts(accounts: Dict[str, AccountConfig]) -> None:
 def _decode_mime_header(value: Optional[str]) -> str:
     if not value:
         return ""
+    if _SURROGATES.search(value):
+        # Raw 8-bit header bytes come back surrogate-escaped; they are nearly
+        # always UTF-8, and lone surrogates can't be stored or displayed.
+        value = value.encode("utf-8", "surrogateescape").decode("utf-8", "replace")
+    if "=?" not in value:
+        # No RFC 2047 encoded words: nothing to decode (the common case).
+        return value
+    return _decode_encoded_words(value)
+
+
+_SURROGATES = re.compile("[\udc80-\udcff]")
+_LATIN1_NAMES = {"iso-8859-1", "iso8859-1", "latin-1", "latin1"}
+_C1_CONTROLS = re.compile(rb"[\x80-\x9f]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_encoded_words(value: str) -> str:
+    # Cached because From/To values repeat heavily within a mailbox.
     try:
         # Decode possibly-mixed encoded words per RFC 2047.
         decoded_fragments = decode_header(value)
         parts: List[str] = []
         for text, enc in decoded_fragments:
             if isinstance(text, bytes):
+                if enc in _LATIN1_NAMES and _C1_CONTROLS.search(text):
+                    # C1 control bytes never appear in real ISO-8859-1 text; the
+                    # sender meant Windows-1252 (smart quotes, euro sign, ...).
+                    enc = "cp1252"
                 try:
                     parts.append(text.decode(enc or "utf-8", errors="replace"))
-                except Exception:
-                    parts.append(text.decode("utf-8", errors="replace"))
+                except LookupError:
+                    parts.append(text.decode("latin-1"))
             else:
                 parts.append(text)
         return "".join(parts)
@@ -137,37 +215,449 @@ def _decode_mime_header(value: Optional[str]) -> str:
         return value
 
 
+# Size of the chunks fed to the MIME parser while a message literal streams in.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _StreamingFetchMixin:
+    """Feed FETCH literals straight into a BytesFeedParser instead of buffering them."""
+
+    _feed_parser: Optional[BytesFeedParser] = None
+
+    def read(self, size):
+        # imaplib calls read(size) for every {size} literal in a response.
+        parser = self._feed_parser
+        if parser is None:
+            return super().read(size)
+        remaining = size
+        while remaining > 0:
+            chunk = super().read(min(remaining, STREAM_CHUNK_SIZE))
+            if not chunk:
+                raise self.abort("socket error: EOF")
+            parser.feed(chunk)
+            remaining -= len(chunk)
+        return b""
+
+    def uid_fetch_message(self, uid: int):
+        """UID FETCH a whole message as a parsed email.message.Message, or None if it is gone."""
+        self._feed_parser = BytesFeedParser()
+        try:
+            # BODY.PEEK[] avoids implicitly setting the \Seen flag.
+            status, data = self.uid("FETCH", str(uid), "(BODY.PEEK[])")
+        finally:
+            parser, self._feed_parser = self._feed_parser, None
+        if status != "OK" or not _parse_fetch_response(data):
+            return None
+        return parser.close()
+
+
+class _StreamingIMAP4(_StreamingFetchMixin, imaplib.IMAP4):
+    pass
+
+
+class _StreamingIMAP4_SSL(_StreamingFetchMixin, imaplib.IMAP4_SSL):
+    pass
+
+
+# Longest a single IMAP/SMTP read or write may block before the connection is
+# treated as dead.
+NETWORK_TIMEOUT_SECONDS = 60
+
+
+def _connect_imap(acc: AccountConfig, readonly: bool = False):
+    """Open an IMAP connection for an account, log in and select INBOX."""
+    if acc.imap_port == 993:
+        # Port 993 is implicit SSL.
+        imap = _StreamingIMAP4_SSL(acc.imap_server, acc.imap_port)
+    else:
+        # For non-SSL ports, attempt STARTTLS if supported.
+        imap = _StreamingIMAP4(acc.imap_server, acc.imap_port)
+        try:
+            imap.starttls()
+        except Exception:
+            pass
+
+    # Connections are long-lived and reused without a liveness probe: a peer that
+    # silently vanished (NAT/firewall drop) must surface as socket.timeout, which
+    # _run_imap treats like any other dead connection.
+    imap.sock.settimeout(NETWORK_TIMEOUT_SECONDS)
+    imap.login(acc.email, acc.password)
+
+    status, _ = imap.select("INBOX", readonly=readonly)
+    if status != "OK":
+        raise RuntimeError("Could not open INBOX")
+    return imap
+
+
+def _selected_uidvalidity(imap) -> int:
+    # SELECT reported UIDVALIDITY; it scopes every UID we cache for this mailbox.
+    _, dat = imap.response("UIDVALIDITY")
+    if not dat or dat[-1] is None:
+        raise RuntimeError("Server did not report UIDVALIDITY for INBOX")
+    return int(dat[-1])
+
+
+def _imap_key(acc: AccountConfig) -> tuple:
+    # Identifies the server/credentials a cached connection was opened with, so
+    # edits to the active account force a reconnect.
+    return (acc.email, acc.password, acc.imap_server, acc.imap_port)
+
+
+def _connect_smtp(acc: AccountConfig) -> smtplib.SMTP:
+    """Open an authenticated SMTP connection for an account."""
+    if acc.smtp_port == 465:
+        # Port 465 uses implicit SSL.
+        server = smtplib.SMTP_SSL(acc.smtp_server, acc.smtp_port, timeout=NETWORK_TIMEOUT_SECONDS)
+    else:
+        # For other ports, attempt STARTTLS if available.
+        server = smtplib.SMTP(acc.smtp_server, acc.smtp_port, timeout=NETWORK_TIMEOUT_SECONDS)
+        try:
+            server.starttls()
+        except Exception:
+            pass
+
+    server.login(acc.email, acc.password)
+    return server
+
+
+# CRLF line endings and 7-bit-safe transfer encodings for outgoing mail.
+_SMTP_POLICY = email.policy.SMTP.clone(cte_type="7bit")
+
+
+def _smtp_key(acc: AccountConfig) -> tuple:
+    return (acc.email, acc.password, acc.smtp_server, acc.smtp_port)
+
+
+# Header fetches larger than this are split across several connections; below
+# it the extra TLS handshakes cost more than they save.
+PARALLEL_FETCH_THRESHOLD = 100
+MAX_FETCH_CONNECTIONS = 4
+
+
+# Only the headers the list shows: skips Received chains, DKIM/ARC signatures, etc.
+HEADER_FETCH_ITEMS = "(UID FLAGS BODY.PEEK[HEADER.FIELDS (SUBJECT FROM TO DATE)])"
+
+
+def _fetch_headers(imap, uids: List[int]) -> list:
+    # Fetch only the listed headers and flags in one round-trip using a
+    # coalesced UID set; bodies are downloaded when a message is opened.
+    status, data = imap.uid("FETCH", _optimize_sequence(uids), HEADER_FETCH_ITEMS)
+    if status != "OK":
+        raise RuntimeError("Fetch failed")
+    return data
+
+
+def _fetch_headers_on_new_connection(acc: AccountConfig, uids: List[int], uidvalidity: int) -> list:
+    """Fetch one shard of headers over a dedicated read-only connection."""
+    imap = _connect_imap(acc, readonly=True)
+    try:
+        if _selected_uidvalidity(imap) != uidvalidity:
+            raise RuntimeError("Mailbox changed on the server during refresh")
+        return _fetch_headers(imap, uids)
+    finally:
+        try:
+            imap.logout()
+        except Exception:
+            pass
+
+
+def _optimize_sequence(ids) -> str:
+    """Coalesce message ids into a compact IMAP sequence set ("10:15,18,20:22")."""
+    nums = sorted({int(i) for i in ids})
+    runs: List[str] = []
+    start = prev = None
+    for n in nums:
+        if start is None:
+            start = prev = n
+        elif n == prev + 1:
+            prev = n
+        else:
+            runs.append(f"{start}:{prev}" if start != prev else str(start))
+            start = prev = n
+    if start is not None:
+        runs.append(f"{start}:{prev}" if start != prev else str(start))
+    return ",".join(runs)
+
+
+# Shared by all list refreshes; parsebytes() keeps no state between calls. The
+# modern policy hands back headers already decoded from RFC 2047.
+_HDR_PARSER = BytesHeaderParser(policy=email.policy.default)
+
+
+_C1_TEXT = re.compile("[\x80-\x9f]")
+
+
+def _raw_header(msg, name: str) -> str:
+    for key, value in msg.raw_items():
+        if key.lower() == name:
+            return _decode_mime_header(value)
+    return ""
+
+
+def _header_text(msg, name: str) -> str:
+    """Return a decoded header from a message parsed with the modern policy."""
+    try:
+        text = str(msg[name] or "")
+    except Exception:
+        # The header registry rejects some malformed headers; decode the raw value.
+        return _raw_header(msg, name)
+    if _C1_TEXT.search(text):
+        # Mislabelled Windows-1252 ("iso-8859-1" smart quotes); the registry
+        # decodes those literally, our own decoder fixes them up.
+        return _raw_header(msg, name)
+    return text
+
+
+_UID_RE = re.compile(rb"UID (\d+)")
+
+
+def _parse_fetch_response(data) -> List[Tuple[int, bytes]]:
+    """Return (uid, literal) pairs from an imaplib FETCH response."""
+    results: List[list] = []
+    for item in data:
+        # Responses alternate (envelope, literal) tuples with b")" continuation entries.
+        if isinstance(item, tuple):
+            match = _UID_RE.search(item[0])
+            results.append([int(match.group(1)) if match else None, item[1]])
+        elif isinstance(item, bytes) and results and results[-1][0] is None:
+            # Some servers send UID after the literal, in the continuation entry.
+            match = _UID_RE.search(item)
+            if match:
+                results[-1][0] = int(match.group(1))
+    return [(uid, literal) for uid, literal in results if uid is not None]
+
+
+def _decode_part_payload(part) -> str:
+    payload = part.get_payload(decode=True) or b""
+    # Trust the declared charset; never guess. latin-1 maps every byte to a code
+    # point, so it is a free fallback that cannot fail.
+    charset = part.get_content_charset() or "latin-1"
+    try:
+        return payload.decode(charset, errors="replace")
+    except LookupError:
+        return payload.decode("latin-1")
+
+
 def _extract_plain_text_body(msg) -> str:
     """Return a best-effort plain text body for an email.message.Message."""
     try:
         if msg.is_multipart():
-            # Prefer text/plain parts to avoid HTML noise.
+            # Single pass: prefer text/plain parts to avoid HTML noise, but remember
+            # the first decodable part as a fallback if no text/plain exists.
+            first_any = None
             for part in msg.walk():
                 if part.get_content_type() == "text/plain":
-                    payload = part.get_payload(decode=True) or b""
-                    charset = part.get_content_charset() or "utf-8"
-                    return payload.decode(charset, errors="replace")
-
-            # Fallback to the first decodable part if no text/plain exists.
-            for part in msg.walk():
-                payload = part.get_payload(decode=True) or b""
-                charset = part.get_content_charset() or "utf-8"
-                return payload.decode(charset, errors="replace")
+                    return _decode_part_payload(part)
+                if first_any is None and part.get_payload(decode=True):
+                    first_any = part
+            return _decode_part_payload(first_any) if first_any is not None else ""
 
         else:
             # Single-part message: decode the payload directly.
-            payload = msg.get_payload(decode=True) or b""
-            charset = msg.get_content_charset() or "utf-8"
-            return payload.decode(charset, errors="replace")
+            return _decode_part_payload(msg)
     except Exception:
         return "(Could not decode message body.)"
 
 
+# ============================================================
+# MESSAGE CACHE (parsed messages in mailcache.db, keyed by
+# account + UIDVALIDITY + UID so refreshes only fetch new mail)
+# ============================================================
+
+CACHE_FILE = "mailcache.db"
+
+# The list is virtual and cached, so it can hold far more than a screenful.
+MAX_LIST_MESSAGES = 1000
+
+
+def _cache_account(acc: AccountConfig) -> str:
+    # The same login on two servers (or after an imap_server edit) is a
+    # different mailbox, so the server is part of the cache key.
+    return f"{acc.email} {acc.imap_server}:{acc.imap_port}"
+
+
+def _open_cache() -> sqlite3.Connection:
+    # A short-lived connection per call keeps the cache usable from worker threads.
+    conn = sqlite3.connect(CACHE_FILE)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS messages ("
+        " account TEXT, uidvalidity INTEGER, uid INTEGER,"
+        " subject TEXT, from_ TEXT, to_ TEXT, body TEXT,"
+        " PRIMARY KEY (account, uidvalidity, uid))"
+    )
+    return conn
+
+
+def load_cached_messages(account: str, uidvalidity: int) -> Dict[int, Dict]:
+    """Return cached messages for an account's INBOX, keyed by UID."""
+    with closing(_open_cache()) as conn:
+        with conn:
+            # UIDs from an older UIDVALIDITY no longer identify the same messages.
+            conn.execute(
+                "DELETE FROM messages WHERE account = ? AND uidvalidity != ?",
+                (account, uidvalidity),
+            )
+        rows = conn.execute(
+            "SELECT uid, subject, from_, to_, body FROM messages"
+            " WHERE account = ? AND uidvalidity = ?",
+            (account, uidvalidity),
+        ).fetchall()
+    return {
+        uid: {"uid": uid, "uidvalidity": uidvalidity, "subject": subj, "from": from_, "to": to_, "body": body}
+        for uid, subj, from_, to_, body in rows
+    }
+
+
+def store_cached_messages(account: str, messages: List[Dict]) -> None:
+    with closing(_open_cache()) as conn, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (account, m["uidvalidity"], m["uid"], m["subject"], m["from"], m["to"], m["body"])
+                for m in messages
+            ],
+        )
+
+
+def store_cached_body(account: str, uidvalidity: int, uid: int, body: str) -> None:
+    with closing(_open_cache()) as conn, conn:
+        conn.execute(
+            "UPDATE messages SET body = ? WHERE account = ? AND uidvalidity = ? AND uid = ?",
+            (body, account, uidvalidity, uid),
+        )
+
+
+def forget_cached_messages(account: str, uidvalidity: int, uids) -> None:
+    # Drop messages that were expunged on the server.
+    with closing(_open_cache()) as conn, conn:
+        conn.executemany(
+            "DELETE FROM messages WHERE account = ? AND uidvalidity = ? AND uid = ?",
+            [(account, uidvalidity, uid) for uid in uids],
+        )
+
+
+# ============================================================
+# IMAP IDLE (push notification of new mail)
+# ============================================================
+
+# RFC 2177: clients should re-issue IDLE at least every 29 minutes.
+IDLE_RENEW_SECONDS = 29 * 60
+# The IDLE socket is silent until new mail or the renewal, so it waits longer.
+IDLE_SOCKET_TIMEOUT_SECONDS = IDLE_RENEW_SECONDS + NETWORK_TIMEOUT_SECONDS
+
+
+class _IdleWatcher(threading.Thread):
+    """Keep a dedicated IMAP connection in IDLE and call on_new_mail on EXISTS."""
+
+    def __init__(self, acc: AccountConfig, on_new_mail):
+        super().__init__(daemon=True)
+        self.acc = acc
+        self.key = _imap_key(acc)
+        self.on_new_mail = on_new_mail
+        self._stopped = threading.Event()
+        self._done_lock = threading.Lock()
+        self._imap = None
+        self._idling = False
+        # True if IDLE could never be entered (no server support, connection
+        # refused, ...); the frame then stops spawning watchers for this account.
+        self.unavailable = False
+        self._entered_idle = False
+
+    def stop(self):
+        self._stopped.set()
+        self._send_done()
+
+    def _send_done(self):
+        # Ends the current IDLE command; safe to call from any thread, any number of times.
+        with self._done_lock:
+            if self._idling:
+                self._idling = False
+                try:
+                    self._imap.send(b"DONE\r\n")
+                except Exception:
+                    pass
+
+    def run(self):
+        try:
+            imap = _connect_imap(self.acc)
+        except Exception:
+            self.unavailable = not self._stopped.is_set()
+            return
+        self._imap = imap
+        try:
+            imap.sock.settimeout(IDLE_SOCKET_TIMEOUT_SECONDS)
+            if "IDLE" not in imap.capabilities:
+                # Server cannot push; the user keeps refreshing manually.
+                self.unavailable = True
+                return
+            while not self._stopped.is_set():
+                if self._idle_once(imap) and not self._stopped.is_set():
+                    self.on_new_mail()
+        except Exception:
+            # Connection dropped; the next successful refresh starts a new watcher,
+            # unless IDLE never worked at all.
+            self.unavailable = not self._entered_idle and not self._stopped.is_set()
+        finally:
+            try:
+                imap.logout()
+            except Exception:
+                pass
+
+    def _idle_once(self, imap) -> bool:
+        """Run one IDLE command until it is terminated; return True if new mail arrived."""
+        tag = imap._new_tag()
+        imap.send(tag + b" IDLE\r\n")
+        if not imap.readline().startswith(b"+"):
+            raise imap.error("IDLE rejected by server")
+
+        with self._done_lock:
+            self._idling = True
+        self._entered_idle = True
+        if self._stopped.is_set():
+            # stop() ran before we entered IDLE.
+            self._send_done()
+
+        timer = threading.Timer(IDLE_RENEW_SECONDS, self._send_done)
+        timer.daemon = True
+        timer.start()
+        new_mail = False
+        try:
+            while True:
+                line = imap.readline()
+                if not line:
+                    raise imap.abort("connection closed during IDLE")
+                if line.startswith(tag):
+                    return new_mail
+                if line.rstrip().upper().endswith(b" EXISTS"):
+                    new_mail = True
+                    self._send_done()
+        finally:
+            timer.cancel()
+
+
 # ============================================================
 # SETTINGS DIALOG (edit one AccountConfig)
 # ============================================================
 
 class SettingsDialog(wx.Dialog):
+    # (label, AccountConfig attribute, TextCtrl style); one txt_<attr> control each.
+    FIELDS = [
+        # Account name used for the display label and internal key.
+        ("Account Name:", "name", 0),
+        # Email address doubles as the IMAP/SMTP username.
+        ("Email (username):", "email", 0),
+        # Password is stored in plaintext for simplicity (no keychain integration).
+        ("Password:", "password", wx.TE_PASSWORD),
+        # IMAP server hosts the inbox for reading.
+        ("IMAP server:", "imap_server", 0),
+        # IMAP port: typically 993 for SSL, 143 for plain/TLS.
+        ("IMAP port:", "imap_port", 0),
+        # SMTP server is used for sending messages.
+        ("SMTP server:", "smtp_server", 0),
+        # SMTP port: typically 587 for STARTTLS, 465 for SSL.
+        ("SMTP port:", "smtp_port", 0),
+    ]
+
     def __init__(self, parent, account: AccountConfig, is_new: bool):
         title = "Add Account" if is_new else "Edit Active Account"
         super().__init__(parent, title=title, style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
@@ -180,47 +670,12 @@ class SettingsDialog(wx.Dialog):
         grid = wx.FlexGridSizer(0, 2, 8, 8)
         grid.AddGrowableCol(1, 1)
 
-        # Account name used for the display label and internal key.
-        grid.Add(wx.StaticText(self, label="Account Name:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_name = wx.TextCtrl(self)
-        self.txt_name.SetValue(account.name)
-        grid.Add(self.txt_name, 1, wx.EXPAND)
-
-        # Email address doubles as the IMAP/SMTP username.
-        grid.Add(wx.StaticText(self, label="Email (username):"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_email = wx.TextCtrl(self)
-        self.txt_email.SetValue(account.email)
-        grid.Add(self.txt_email, 1, wx.EXPAND)
-
-        # Password is stored in plaintext for simplicity (no keychain integration).
-        grid.Add(wx.StaticText(self, label="Password:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_password = wx.TextCtrl(self, style=wx.TE_PASSWORD)
-        self.txt_password.SetValue(account.password)
-        grid.Add(self.txt_password, 1, wx.EXPAND)
-
-        # IMAP server hosts the inbox for reading.
-        grid.Add(wx.StaticText(self, label="IMAP server:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_imap_server = wx.TextCtrl(self)
-        self.txt_imap_server.SetValue(account.imap_server)
-        grid.Add(self.txt_imap_server, 1, wx.EXPAND)
-
-        # IMAP port: typically 993 for SSL, 143 for plain/TLS.
-        grid.Add(wx.StaticText(self, label="IMAP port:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_imap_port = wx.TextCtrl(self)
-        self.txt_imap_port.SetValue(str(account.imap_port))
-        grid.Add(self.txt_imap_port, 1, wx.EXPAND)
-
-        # SMTP server is used for sending messages.
-        grid.Add(wx.StaticText(self, label="SMTP server:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_smtp_server = wx.TextCtrl(self)
-        self.txt_smtp_server.SetValue(account.smtp_server)
-        grid.Add(self.txt_smtp_server, 1, wx.EXPAND)
-
-        # SMTP port: typically 587 for STARTTLS, 465 for SSL.
-        grid.Add(wx.StaticText(self, label="SMTP port:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        self.txt_smtp_port = wx.TextCtrl(self)
-        self.txt_smtp_port.SetValue(str(account.smtp_port))
-        grid.Add(self.txt_smtp_port, 1, wx.EXPAND)
+        for label, attr, style in self.FIELDS:
+            grid.Add(wx.StaticText(self, label=label), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
+            ctrl = wx.TextCtrl(self, style=style)
+            ctrl.SetValue(str(getattr(account, attr)))
+            setattr(self, f"txt_{attr}", ctrl)
+            grid.Add(ctrl, 1, wx.EXPAND)
 
         main.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
 
@@ -239,33 +694,32 @@ class SettingsDialog(wx.Dialog):
         ok_btn.Bind(wx.EVT_BUTTON, self.on_save)
 
     def on_save(self, event):
+        values = {attr: getattr(self, f"txt_{attr}").GetValue() for _, attr, _ in self.FIELDS}
+        for attr, val in values.items():
+            # The password is kept verbatim; everything else is trimmed.
+            if attr != "password":
+                values[attr] = val.strip()
+
         # Validate required fields before committing changes.
-        name = self.txt_name.GetValue().strip()
-        if not name:
+        if not values["name"]:
             wx.MessageBox("Account name cannot be empty.", "Error", wx.OK | wx.ICON_ERROR)
             return
 
-        email_addr = self.txt_email.GetValue().strip()
-        if not email_addr:
+        if not values["email"]:
             wx.MessageBox("Email cannot be empty.", "Error", wx.OK | wx.ICON_ERROR)
             return
 
         try:
             # Port values are typed as integers in AccountConfig.
-            imap_port = int(self.txt_imap_port.GetValue().strip())
-            smtp_port = int(self.txt_smtp_port.GetValue().strip())
+            values["imap_port"] = int(values["imap_port"])
+            values["smtp_port"] = int(values["smtp_port"])
         except ValueError:
             wx.MessageBox("IMAP and SMTP ports must be integers.", "Error", wx.OK | wx.ICON_ERROR)
             return
 
         # Persist changes back to the provided AccountConfig instance.
-        self.account.name = name
-        self.account.email = email_addr
-        self.account.password = self.txt_password.GetValue()
-        self.account.imap_server = self.txt_imap_server.GetValue().strip()
-        self.account.imap_port = imap_port
-        self.account.smtp_server = self.txt_smtp_server.GetValue().strip()
-        self.account.smtp_port = smtp_port
+        for attr, val in values.items():
+            setattr(self.account, attr, val)
 
         self.EndModal(wx.ID_OK)
 
@@ -324,6 +778,31 @@ class ComposeDialog(wx.Dialog):
         )
 
 
+# ============================================================
+# EMAIL LIST (virtual list control)
+# ============================================================
+
+class EmailListCtrl(wx.ListCtrl):
+    """Virtual list that pulls subjects from the frame's messages on demand."""
+
+    def __init__(self, parent, frame):
+        super().__init__(
+            parent,
+            style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL
+        )
+        self.frame = frame
+
+    def OnGetItemText(self, item, column):
+        # Called by wx only for rows that are actually visible.
+        return self.frame.messages[item]["subject"]
+
+    def reset(self, count: int = 0):
+        # Drop the current selection and show `count` rows from frame.messages.
+        self.DeleteAllItems()
+        self.SetItemCount(count)
+        self.Refresh()
+
+
 # ============================================================
 # MAIN APPLICATION FRAME
 # ============================================================
@@ -334,22 +813,49 @@ class EmailClientFrame(wx.Frame):
         self.Centre()
 
         # Load known accounts from disk and choose a default active account.
-        self.accounts: Dict[str, AccountConfig] = load_all_accounts()
+        try:
+            self.accounts: Dict[str, AccountConfig] = load_all_accounts()
+        except (configparser.Error, UnicodeDecodeError, ValueError) as e:
+            wx.MessageBox(
+                f"Could not read {CONFIG_FILE}; starting without accounts.\n"
+                f"Saving an account will overwrite the file.\n\n{e}",
+                "Accounts", wx.OK | wx.ICON_WARNING,
+            )
+            self.accounts = {}
         self.active_account: Optional[AccountConfig] = None
 
         if self.accounts:
-            # Pick first account as active
-            first_name = sorted(self.accounts.keys())[0]
+            # Pick first account (alphabetically) as active
+            first_name = min(self.accounts)
             self.active_account = self.accounts[first_name]
 
         # List of parsed message dictionaries for the active mailbox view.
         self.messages: List[Dict] = []
 
+        # Persistent IMAP connection reused across refreshes; only touched by
+        # worker threads while holding _imap_lock.
+        self._imap: Optional[imaplib.IMAP4] = None
+        self._imap_key: Optional[tuple] = None
+        self._imap_uidvalidity: Optional[int] = None
+        self._imap_lock = threading.Lock()
+
+        # Likewise an authenticated SMTP connection kept warm between sends.
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_key: Optional[tuple] = None
+        self._smtp_lock = threading.Lock()
+        self._idle_watcher: Optional[_IdleWatcher] = None
+        # Account keys whose server refused or lacks IDLE; never retried this session.
+        self._idle_unavailable: set = set()
+        # Set while a pushed refresh re-selects the current row programmatically.
+        self._restoring_selection = False
+
         self.panel = wx.Panel(self)
 
         self._create_menu()
         self._create_layout()
 
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
     # ------------------------------
     # MENU
     # ------------------------------
@@ -360,7 +866,6 @@ class EmailClientFrame(wx.Frame):
         # Account management actions.
         self.menu_item_add_account = file_menu.Append(wx.ID_ANY, "Add Account…")
         self.menu_item_switch_root = file_menu.AppendSubMenu(wx.Menu(), "Switch Account")
-        self.switch_acc_parent_item = self.menu_item_switch_root
         self.switch_acc_menu: wx.Menu = self.menu_item_switch_root.GetSubMenu()
 
         self.menu_item_delete_account = file_menu.Append(wx.ID_ANY, "Delete Account…")
@@ -377,28 +882,54 @@ class EmailClientFrame(wx.Frame):
         self.Bind(wx.EVT_MENU, self.on_edit_active_account, self.menu_item_edit_active)
         self.Bind(wx.EVT_MENU, lambda evt: self.Close(), exit_item)
 
-        self._rebuild_switch_account_menu()
-
-    def _rebuild_switch_account_menu(self):
-        # Replace submenu with a fresh one each time
-        if hasattr(self, "switch_acc_menu") and self.switch_acc_menu is not None:
-            # Detach old submenu and destroy it
-            self.switch_acc_parent_item.SetSubMenu(None)
-            self.switch_acc_menu.Destroy()
-
-        self.switch_acc_menu = wx.Menu()
-        self.switch_acc_parent_item.SetSubMenu(self.switch_acc_menu)
-
-        if not self.accounts:
+        # The submenu is kept sorted and updated item by item as accounts change.
+        self._switch_items: Dict[str, wx.MenuItem] = {}
+        self._switch_names: List[str] = []
+        self._switch_placeholder: Optional[wx.MenuItem] = None
+        for name in sorted(self.accounts):
+            self._add_switch_item(name)
+        self._update_switch_placeholder()
+
+    def _add_switch_item(self, name: str):
+        pos = bisect.bisect(self._switch_names, name)
+        self._switch_names.insert(pos, name)
+        item = self.switch_acc_menu.Insert(pos, wx.ID_ANY, name)
+        self._switch_items[name] = item
+        self.Bind(wx.EVT_MENU, self.on_switch_menu_item, item)
+        self._update_switch_placeholder()
+
+    def _remove_switch_item(self, name: str):
+        item = self._switch_items.pop(name)
+        self._switch_names.remove(name)
+        self.Unbind(wx.EVT_MENU, item)
+        self.switch_acc_menu.Destroy(item)
+        self._update_switch_placeholder()
+
+    def _rename_switch_item(self, old_name: str, new_name: str):
+        # Move the existing item to its new sorted position; its binding stays valid.
+        item = self._switch_items.pop(old_name)
+        self._switch_names.remove(old_name)
+        self.switch_acc_menu.Remove(item)
+        item.SetItemLabel(new_name)
+        pos = bisect.bisect(self._switch_names, new_name)
+        self._switch_names.insert(pos, new_name)
+        self.switch_acc_menu.Insert(pos, item)
+        self._switch_items[new_name] = item
+
+    def _update_switch_placeholder(self):
+        if self._switch_items and self._switch_placeholder is not None:
+            self.switch_acc_menu.Destroy(self._switch_placeholder)
+            self._switch_placeholder = None
+        elif not self._switch_items and self._switch_placeholder is None:
             # Show a disabled placeholder when no accounts exist.
-            disabled_item = self.switch_acc_menu.Append(wx.ID_ANY, "(no accounts)")
-            disabled_item.Enable(False)
-            return
+            self._switch_placeholder = self.switch_acc_menu.Append(wx.ID_ANY, "(no accounts)")
+            self._switch_placeholder.Enable(False)
 
-        for name in sorted(self.accounts.keys()):
-            item = self.switch_acc_menu.Append(wx.ID_ANY, name)
-            # capture name in default argument
-            self.Bind(wx.EVT_MENU, lambda evt, n=name: self.on_switch_account(n), item)
+    def on_switch_menu_item(self, event):
+        for name, item in self._switch_items.items():
+            if item.GetId() == event.GetId():
+                self.on_switch_account(name)
+                return
 
     # ------------------------------
     # LAYOUT
@@ -417,10 +948,7 @@ class EmailClientFrame(wx.Frame):
 
         left_sizer.Add(top_buttons, 0)
 
-        self.email_list = wx.ListCtrl(
-            self.panel,
-            style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL
-        )
+        self.email_list = EmailListCtrl(self.panel, self)
         self.email_list.InsertColumn(0, "Subject", width=260)
         left_sizer.Add(self.email_list, 1, wx.EXPAND | wx.ALL, 5)
 
@@ -482,7 +1010,7 @@ class EmailClientFrame(wx.Frame):
             else:
                 self.accounts[new_acc.name] = new_acc
                 save_all_accounts(self.accounts)
-                self._rebuild_switch_account_menu()
+                self._add_switch_item(new_acc.name)
                 if self.active_account is None:
                     # If there was no active account, use the new one.
                     self.active_account = new_acc
@@ -494,16 +1022,18 @@ class EmailClientFrame(wx.Frame):
             wx.MessageBox("No accounts to delete.", "Delete Account", wx.OK | wx.ICON_INFORMATION)
             return
 
-        names = sorted(self.accounts.keys())
+        # The Switch Account menu already keeps the names sorted.
+        names = list(self._switch_names)
         dlg = wx.SingleChoiceDialog(self, "Select an account to delete:", "Delete Account", names)
         if dlg.ShowModal() == wx.ID_OK:
             selected = dlg.GetStringSelection()
             if selected in self.accounts:
                 if (self.active_account is not None) and (self.active_account.name == selected):
                     # Deleting current active account
+                    self._disconnect()
                     self.active_account = None
                     self.messages.clear()
-                    self.email_list.DeleteAllItems()
+                    self.email_list.reset()
                     self.lbl_from_value.SetLabel("(select email)")
                     self.lbl_to_value.SetLabel("-")
                     self.lbl_subject_value.SetLabel("-")
@@ -511,7 +1041,7 @@ class EmailClientFrame(wx.Frame):
                 # Remove account from memory and persist updated list.
                 del self.accounts[selected]
                 save_all_accounts(self.accounts)
-                self._rebuild_switch_account_menu()
+                self._remove_switch_item(selected)
         dlg.Destroy()
 
     def on_switch_account(self, account_name: str):
@@ -519,9 +1049,10 @@ class EmailClientFrame(wx.Frame):
         if account_name not in self.accounts:
             wx.MessageBox("Account not found.", "Switch Account", wx.OK | wx.ICON_ERROR)
             return
+        self._disconnect()
         self.active_account = self.accounts[account_name]
         self.messages.clear()
-        self.email_list.DeleteAllItems()
+        self.email_list.reset()
         self.lbl_from_value.SetLabel("(select email)")
         self.lbl_to_value.SetLabel("-")
         self.lbl_subject_value.SetLabel("-")
@@ -533,8 +1064,13 @@ class EmailClientFrame(wx.Frame):
             return
 
         old_name = self.active_account.name
+        old_keys = (_imap_key(self.active_account), _smtp_key(self.active_account))
         dlg = SettingsDialog(self, self.active_account, is_new=False)
         if dlg.ShowModal() == wx.ID_OK:
+            if (_imap_key(self.active_account), _smtp_key(self.active_account)) != old_keys:
+                # Server or credentials changed: drop connections opened with the old ones.
+                self._disconnect()
+
             new_name = self.active_account.name or old_name
 
             # If the name changed, handle dictionary key move
@@ -546,11 +1082,102 @@ class EmailClientFrame(wx.Frame):
                     # Replace the dictionary key to reflect the new account name.
                     del self.accounts[old_name]
                     self.accounts[new_name] = self.active_account
+                    self._rename_switch_item(old_name, new_name)
 
             save_all_accounts(self.accounts)
-            self._rebuild_switch_account_menu()
         dlg.Destroy()
 
+    # ============================================================
+    # IMAP CONNECTION
+    # ============================================================
+    def _run_imap(self, acc: AccountConfig, operation):
+        """Run operation(imap, uidvalidity) on the persistent connection for acc.
+
+        A reused connection is not probed with NOOP first (that would add a round
+        trip to every request); if it turns out to be dead, reconnect once and retry.
+        """
+        with self._imap_lock:
+            reused = self._imap is not None and self._imap_key == _imap_key(acc)
+            if not reused:
+                self._reconnect_imap(acc)
+            try:
+                return operation(self._imap, self._imap_uidvalidity)
+            except (imaplib.IMAP4.abort, OSError):
+                # OSError includes socket.timeout from a silently dropped peer.
+                if not reused:
+                    raise
+                self._reconnect_imap(acc)
+                return operation(self._imap, self._imap_uidvalidity)
+
+    def _reconnect_imap(self, acc: AccountConfig):
+        # Must be called with _imap_lock held.
+        self._logout_imap()
+        imap = _connect_imap(acc)
+        try:
+            uidvalidity = _selected_uidvalidity(imap)
+        except Exception:
+            imap.logout()
+            raise
+        self._imap, self._imap_key, self._imap_uidvalidity = imap, _imap_key(acc), uidvalidity
+
+    def _logout_imap(self):
+        # Must be called with _imap_lock held.
+        imap, self._imap, self._imap_key, self._imap_uidvalidity = self._imap, None, None, None
+        if imap is not None:
+            try:
+                imap.logout()
+            except Exception:
+                pass
+
+    def _disconnect(self):
+        """Stop IDLE and close the cached IMAP/SMTP connections without blocking the GUI."""
+        if self._idle_watcher is not None:
+            self._idle_watcher.stop()
+            self._idle_watcher = None
+
+        def release(imap_key=self._imap_key, smtp_key=self._smtp_key):
+            # A worker for another account may have reconnected meanwhile.
+            with self._imap_lock:
+                if self._imap_key == imap_key:
+                    self._logout_imap()
+            with self._smtp_lock:
+                if self._smtp_key == smtp_key:
+                    self._quit_smtp()
+
+        threading.Thread(target=release, daemon=True).start()
+
+    def _start_idle_watcher(self, acc: AccountConfig):
+        key = _imap_key(acc)
+        imap = self._imap
+        if imap is not None and self._imap_key == key and "IDLE" not in imap.capabilities:
+            # The server has no IDLE; don't pay a handshake per refresh to rediscover it.
+            return
+        watcher = self._idle_watcher
+        if watcher is not None and watcher.key == key:
+            if watcher.is_alive():
+                return
+            if watcher.unavailable:
+                self._idle_unavailable.add(key)
+        if key in self._idle_unavailable:
+            return
+        if watcher is not None:
+            watcher.stop()
+        self._idle_watcher = _IdleWatcher(acc, lambda: wx.CallAfter(self._on_new_mail, acc))
+        self._idle_watcher.start()
+
+    def _on_new_mail(self, acc: AccountConfig):
+        # Pushed by the IDLE watcher; skip if a refresh is already running. This is a
+        # quiet refresh: the message being read stays selected and on screen.
+        if acc is self.active_account and self.btn_refresh.IsEnabled():
+            self.btn_refresh.Disable()
+            threading.Thread(target=self._fetch_worker, args=(acc, True), daemon=True).start()
+
+    def on_close(self, event):
+        # LOGOUT/QUIT are best effort on a daemon thread; a slow server must not
+        # keep the window from closing.
+        self._disconnect()
+        event.Skip()
+
     # ============================================================
     # IMAP FETCH
     # ============================================================
@@ -559,83 +1186,164 @@ class EmailClientFrame(wx.Frame):
             wx.MessageBox("No active account. Add one from File → Add Account…", "Refresh", wx.OK | wx.ICON_INFORMATION)
             return
 
-        acc = self.active_account
-        try:
-            # Give the user immediate feedback before network work.
-            self.body_text.SetValue("Loading emails from server...\n")
-            wx.GetApp().Yield()
-
-            # Connect
-            if acc.imap_port == 993:
-                # Port 993 is implicit SSL.
-                imap = imaplib.IMAP4_SSL(acc.imap_server, acc.imap_port)
-            else:
-                # For non-SSL ports, attempt STARTTLS if supported.
-                imap = imaplib.IMAP4(acc.imap_server, acc.imap_port)
-                try:
-                    imap.starttls()
-                except Exception:
-                    pass
-
-            imap.login(acc.email, acc.password)
+        # Give the user immediate feedback; the network work runs on a background
+        # thread so the event loop keeps pumping while we wait on the server.
+        self.btn_refresh.Disable()
+        self.body_text.SetValue("Loading emails from server...\n")
+        threading.Thread(target=self._fetch_worker, args=(self.active_account,), daemon=True).start()
 
-            status, _ = imap.select("INBOX")
-            if status != "OK":
-                raise RuntimeError("Could not open INBOX")
+    def _fetch_worker(self, acc: AccountConfig, quiet: bool = False):
+        # Runs off the GUI thread: never touch widgets here, hand results back via CallAfter.
+        try:
+            messages, error = self._fetch_messages(acc), None
+        except Exception as e:
+            messages, error = None, e
+        wx.CallAfter(self._apply_fetched, acc, messages, error, quiet)
 
-            status, data = imap.search(None, "ALL")
+    def _fetch_messages(self, acc: AccountConfig) -> List[Dict]:
+        def sync(imap, uidvalidity):
+            status, data = imap.uid("SEARCH", None, "ALL")
             if status != "OK":
                 raise RuntimeError("Search failed")
 
-            ids = data[0].split()
-            if not ids:
-                # Empty inbox: clear the UI and stop early.
-                self.messages.clear()
-                self.email_list.DeleteAllItems()
-                self.body_text.SetValue("INBOX is empty.")
-                imap.close()
-                imap.logout()
-                return
-
-            # Limit to the most recent 20 messages for faster UI updates.
-            latest_ids = ids[-20:]  # last 20
-            self.messages = []
-            self.email_list.DeleteAllItems()
-
-            # Newest first so the top of the list is the latest email.
-            for msg_id in reversed(latest_ids):
-                status, msg_data = imap.fetch(msg_id, "(RFC822)")
-                if status != "OK" or not msg_data or msg_data[0] is None:
-                    continue
-                raw = msg_data[0][1]
-                msg = email.message_from_bytes(raw)
-
-                # Decode headers and body into display-friendly strings.
-                subj = _decode_mime_header(msg.get("Subject")) or "(no subject)"
-                from_ = _decode_mime_header(msg.get("From")) or ""
-                to_ = _decode_mime_header(msg.get("To")) or ""
-                body = _extract_plain_text_body(msg)
-
-                # Store message metadata for later display.
-                self.messages.append(
-                    {"id": msg_id, "subject": subj, "from": from_, "to": to_, "body": body}
-                )
-                self.email_list.InsertItem(self.email_list.GetItemCount(), subj)
+            uids = [int(u) for u in data[0].split()]
+            # Limit the list to the most recent messages.
+            latest_uids = uids[-MAX_LIST_MESSAGES:]
+
+            # Only messages missing from the local cache go over the wire.
+            cached = load_cached_messages(_cache_account(acc), uidvalidity)
+            missing = [uid for uid in latest_uids if uid not in cached]
+
+            data = []
+            if len(missing) > PARALLEL_FETCH_THRESHOLD:
+                # Large backlog: split into contiguous shards (so each stays a compact
+                # UID set) and fetch them over parallel connections, one of them ours.
+                size = -(-len(missing) // MAX_FETCH_CONNECTIONS)
+                shards = [missing[i:i + size] for i in range(0, len(missing), size)]
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(shards) - 1)) as ex:
+                    futures = [
+                        ex.submit(_fetch_headers_on_new_connection, acc, shard, uidvalidity)
+                        for shard in shards[1:]
+                    ]
+                    data = _fetch_headers(imap, shards[0])
+                    for shard, future in zip(shards[1:], futures):
+                        try:
+                            data += future.result()
+                        except Exception:
+                            # Parallelism is best-effort (servers may cap connections):
+                            # fall back to our own connection for this shard.
+                            data += _fetch_headers(imap, shard)
+            elif missing:
+                data = _fetch_headers(imap, missing)
+            return uidvalidity, uids, cached, data
+
+        # An empty INBOX falls through so its cached rows are forgotten below.
+        uidvalidity, uids, cached, data = self._run_imap(acc, sync)
+        latest_uids = uids[-MAX_LIST_MESSAGES:]
+
+        fetched = []
+        for uid, raw in _parse_fetch_response(data):
+            # Headers only: stop at the header/body boundary, no MIME tree.
+            msg = _HDR_PARSER.parsebytes(raw)
+
+            # Decode headers into display-friendly strings; the body stays None
+            # until the message is selected.
+            try:
+                subj = _header_text(msg, "subject") or "(no subject)"
+                from_ = _header_text(msg, "from")
+                to_ = _header_text(msg, "to")
+            except Exception:
+                # One malformed message must not take the whole list down.
+                subj, from_, to_ = "(unreadable headers)", "", ""
+            body = None
+
+            fetched.append(
+                {"uid": uid, "uidvalidity": uidvalidity, "subject": subj, "from": from_, "to": to_, "body": body}
+            )
+        store_cached_messages(_cache_account(acc), fetched)
+
+        expunged = cached.keys() - set(uids)
+        if expunged:
+            forget_cached_messages(_cache_account(acc), uidvalidity, expunged)
+
+        cached.update((m["uid"], m) for m in fetched)
+        # Newest first so the top of the list is the latest email.
+        return [cached[uid] for uid in reversed(latest_uids) if uid in cached]
+
+    def _apply_fetched(
+        self, acc: AccountConfig, messages: Optional[List[Dict]], error: Optional[Exception], quiet: bool = False
+    ):
+        self.btn_refresh.Enable()
+        if acc is not self.active_account:
+            # The user switched accounts while the fetch was in flight.
+            return
 
-            self.body_text.SetValue("Emails loaded. Select one on the left.")
-            imap.close()
-            imap.logout()
+        if quiet:
+            # Background refresh pushed by IDLE: errors surface on the next manual refresh.
+            if error is None:
+                self._apply_pushed(messages)
+            return
 
-        except imaplib.IMAP4.error as e:
+        if isinstance(error, imaplib.IMAP4.error):
             # IMAP errors usually indicate auth or server issues.
-            wx.MessageBox(f"IMAP error:\n{e}", "IMAP Error", wx.OK | wx.ICON_ERROR)
-        except Exception as e:
-            wx.MessageBox(f"Error while fetching emails:\n{e}", "Error", wx.OK | wx.ICON_ERROR)
+            wx.MessageBox(f"IMAP error:\n{error}", "IMAP Error", wx.OK | wx.ICON_ERROR)
+            return
+        if error is not None:
+            wx.MessageBox(f"Error while fetching emails:\n{error}", "Error", wx.OK | wx.ICON_ERROR)
+            return
+
+        # Let the server push new-mail notifications instead of polling.
+        self._start_idle_watcher(acc)
+
+        # Rows are rendered on demand from self.messages by EmailListCtrl.
+        self.messages = messages
+        self.email_list.reset(len(messages))
+        if not messages:
+            # Empty inbox: clear the UI and stop early.
+            self.body_text.SetValue("INBOX is empty.")
+            return
+
+        self.body_text.SetValue("Emails loaded. Select one on the left.")
+
+    def _apply_pushed(self, messages: List[Dict]):
+        """Show a refreshed list while keeping the message being read selected."""
+        idx = self.email_list.GetFirstSelected()
+        selected = self.messages[idx] if 0 <= idx < len(self.messages) else None
+
+        new_idx = -1
+        if selected is not None:
+            for i, msg in enumerate(messages):
+                if msg["uid"] == selected["uid"]:
+                    # Keep the same dict so a body load in flight still lands on screen.
+                    messages[i] = selected
+                    new_idx = i
+                    break
+
+        self.messages = messages
+        self.email_list.reset(len(messages))
+        if new_idx >= 0:
+            # Restore the selection without re-running on_select_email.
+            self._restoring_selection = True
+            try:
+                self.email_list.SetItemState(
+                    new_idx, wx.LIST_STATE_SELECTED | wx.LIST_STATE_FOCUSED,
+                    wx.LIST_STATE_SELECTED | wx.LIST_STATE_FOCUSED,
+                )
+            finally:
+                self._restoring_selection = False
+        elif selected is not None:
+            # The message being read was removed on the server.
+            self.lbl_from_value.SetLabel("(select email)")
+            self.lbl_to_value.SetLabel("-")
+            self.lbl_subject_value.SetLabel("-")
+            self.body_text.SetValue("Emails loaded. Select one on the left.")
 
     # ============================================================
     # EMAIL VIEW
     # ============================================================
     def on_select_email(self, event):
+        if self._restoring_selection:
+            return
         # Update the preview pane to match the selected email row.
         idx = event.GetIndex()
         if idx < 0 or idx >= len(self.messages):
@@ -644,8 +1352,56 @@ class EmailClientFrame(wx.Frame):
         self.lbl_from_value.SetLabel(msg["from"])
         self.lbl_to_value.SetLabel(msg["to"])
         self.lbl_subject_value.SetLabel(msg["subject"])
+        if msg["body"] is None:
+            # Download the full message on first view in the background.
+            self.body_text.SetValue("Loading message...")
+            if msg.get("loading"):
+                # Already being fetched; _apply_body shows it when it arrives.
+                return
+            msg["loading"] = True
+            threading.Thread(target=self._body_worker, args=(self.active_account, msg), daemon=True).start()
+            return
         self.body_text.SetValue(msg["body"])
 
+    def _body_worker(self, acc: AccountConfig, msg: Dict):
+        try:
+            body, error = self._fetch_body(acc, msg), None
+        except Exception as e:
+            body, error = None, e
+        wx.CallAfter(self._apply_body, msg, body, error)
+
+    def _fetch_body(self, acc: AccountConfig, msg: Dict) -> str:
+        def fetch(imap, uidvalidity):
+            if uidvalidity != msg["uidvalidity"]:
+                raise RuntimeError("Mailbox changed on the server; please refresh")
+            # The message is parsed while it streams in, never held as one bytes blob.
+            return imap.uid_fetch_message(msg["uid"])
+
+        parsed = self._run_imap(acc, fetch)
+        if parsed is None:
+            raise RuntimeError("Message is no longer available on the server")
+        body = _extract_plain_text_body(parsed)
+        store_cached_body(_cache_account(acc), msg["uidvalidity"], msg["uid"], body)
+        return body
+
+    def _apply_body(self, msg: Dict, body: Optional[str], error: Optional[Exception]):
+        msg.pop("loading", None)
+        if body is not None:
+            # Memoize the decoded body so reopening the message is instant.
+            msg["body"] = body
+
+        # Only update the preview if the message is still the one being shown.
+        idx = self.email_list.GetFirstSelected()
+        if idx < 0 or idx >= len(self.messages) or self.messages[idx] is not msg:
+            return
+
+        if isinstance(error, imaplib.IMAP4.error):
+            self.body_text.SetValue(f"IMAP error while loading message:\n{error}")
+        elif error is not None:
+            self.body_text.SetValue(f"Error while loading message:\n{error}")
+        else:
+            self.body_text.SetValue(body)
+
     # ============================================================
     # SMTP SEND
     # ============================================================
@@ -670,37 +1426,69 @@ class EmailClientFrame(wx.Frame):
                 dlg.Destroy()
                 return
 
+            # Send in the background so the window stays responsive during SMTP I/O.
+            self.btn_compose.Disable()
+            threading.Thread(
+                target=self._send_worker, args=(acc, recipients, subject, body), daemon=True
+            ).start()
+
+        dlg.Destroy()
+
+    def _send_worker(self, acc: AccountConfig, recipients: List[str], subject: str, body: str):
+        try:
+            self._send_mail(acc, recipients, subject, body)
+            error = None
+        except Exception as e:
+            error = e
+        wx.CallAfter(self._apply_sent, error)
+
+    def _send_mail(self, acc: AccountConfig, recipients: List[str], subject: str, body: str):
+        # EmailMessage handles RFC 2047 headers, MIME/transfer encoding and CRLFs.
+        # A 7bit policy makes non-ASCII bodies quoted-printable, so servers without
+        # 8BITMIME accept them too.
+        msg = EmailMessage(policy=_SMTP_POLICY)
+        msg["From"] = acc.email
+        msg["To"] = ", ".join(recipients)
+        msg["Subject"] = subject
+        msg.set_content(body)
+
+        with self._smtp_lock:
+            server = self._ensure_smtp(acc)
+            server.send_message(msg, from_addr=acc.email, to_addrs=recipients)
+
+    def _ensure_smtp(self, acc: AccountConfig) -> smtplib.SMTP:
+        """Return a live SMTP connection for acc, reconnecting only if NOOP fails.
+
+        Unlike IMAP we probe first: retrying a half-sent message could deliver it
+        twice. Must be called with _smtp_lock held.
+        """
+        key = _smtp_key(acc)
+        if self._smtp is not None and self._smtp_key == key:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except Exception:
+                pass
+        self._quit_smtp()
+        self._smtp = _connect_smtp(acc)
+        self._smtp_key = key
+        return self._smtp
+
+    def _quit_smtp(self):
+        # Must be called with _smtp_lock held.
+        server, self._smtp, self._smtp_key = self._smtp, None, None
+        if server is not None:
             try:
-                # Build a minimal RFC 5322 message with headers and body.
-                msg_lines = [
-                    f"From: {acc.email}",
-                    f"To: {', '.join(recipients)}",
-                    f"Subject: {subject}",
-                    "",
-                    body,
-                ]
-                msg_str = "\r\n".join(msg_lines)
-
-                if acc.smtp_port == 465:
-                    # Port 465 uses implicit SSL.
-                    server = smtplib.SMTP_SSL(acc.smtp_server, acc.smtp_port)
-                else:
-                    # For other ports, attempt STARTTLS if available.
-                    server = smtplib.SMTP(acc.smtp_server, acc.smtp_port)
-                    try:
-                        server.starttls()
-                    except Exception:
-                        pass
-
-                server.login(acc.email, acc.password)
-                server.sendmail(acc.email, recipients, msg_str)
                 server.quit()
+            except Exception:
+                pass
 
-                wx.MessageBox("Email sent successfully.", "Compose", wx.OK | wx.ICON_INFORMATION)
-            except Exception as e:
-                wx.MessageBox(f"SMTP error:\n{e}", "SMTP Error", wx.OK | wx.ICON_ERROR)
-
-        dlg.Destroy()
+    def _apply_sent(self, error: Optional[Exception]):
+        self.btn_compose.Enable()
+        if error is not None:
+            wx.MessageBox(f"SMTP error:\n{error}", "SMTP Error", wx.OK | wx.ICON_ERROR)
+        else:
+            wx.MessageBox("Email sent successfully.", "Compose", wx.OK | wx.ICON_INFORMATION)
 
 
 # ============================================================